@@ -0,0 +1,136 @@
+# cython: language_level=3, boundscheck=False
+"""
+Hot-path extraction helpers for merge-findings.py.
+
+Kept as a leaf module with no third-party requirements so it can be
+compiled with Cython (merge-findings.py --jit) or run as-is under PyPy;
+either way the per-block parsing loop avoids interpreter overhead.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+
+@dataclass(slots=True)
+class Finding:
+    """One extracted research finding.
+
+    Slots keep the per-finding footprint to a fixed layout instead of a
+    7-key dict, and attribute reads skip the hash lookup in every
+    downstream loop.
+    """
+    source: str
+    title: str = ''
+    url: str = ''
+    relevance: str = 'unknown'
+    excerpts: List[str] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    raw: str = ''
+
+
+# Single alternation covering URL, relevance and excerpt lines so each
+# result block is scanned once instead of once per field
+# re.ASCII: the markers and URL tokens are ASCII, so \s/\S/\d can skip
+# the per-character Unicode property lookups
+_BLOCK_RE = re.compile(
+    r'\*\*URL\*\*:\s*(?P<url>\S+)'
+    r'|(?i:\*\*Relevance\*\*:\s*(?P<rel>\d+|high|medium|low))'
+    r'|>\s*(?P<excerpt>.+)',
+    re.ASCII
+)
+
+# Common technical terms to look for when tagging findings with topics
+TECH_TERMS = (
+    'rag', 'llm', 'embedding', 'vector', 'chunk', 'retrieval',
+    'architecture', 'implementation', 'performance', 'latency',
+    'accuracy', 'benchmark', 'production', 'scalability',
+    'api', 'model', 'training', 'inference', 'fine-tuning'
+)
+
+# Multi-pattern matching: a single Aho-Corasick pass when pyahocorasick is
+# installed, otherwise one alternation regex sweep - either way the text is
+# scanned once instead of once per term
+try:
+    import ahocorasick
+
+    _TOPIC_AUTOMATON = ahocorasick.Automaton()
+    for _term in TECH_TERMS:
+        _TOPIC_AUTOMATON.add_word(_term, _term)
+    _TOPIC_AUTOMATON.make_automaton()
+except ImportError:
+    _TOPIC_AUTOMATON = None
+
+# Terms paired with their ASCII encoding for the bytes fast path below
+_TERM_BYTES = tuple((term, term.encode('ascii')) for term in TECH_TERMS)
+
+# No term is shorter than this, so smaller regions cannot match anything
+_MIN_TERM_LEN = min(len(term) for term in TECH_TERMS)
+
+
+def match_topics(text_lower: str, start: int = 0, end: int = None) -> List[str]:
+    """Match known topic keywords against a region of lowercased text"""
+    if end is None:
+        end = len(text_lower)
+    if end - start < _MIN_TERM_LEN:
+        return []
+
+    if _TOPIC_AUTOMATON is not None:
+        found = (term for _, term in _TOPIC_AUTOMATON.iter(text_lower, start, end))
+        # Deduplicate while keeping first-match order so reports are stable
+        return list(dict.fromkeys(found))
+
+    # Bytes fast path: encode the region once, then each membership test is
+    # a memmem-backed bytes.__contains__ rather than a str codepoint walk
+    region = text_lower[start:end].encode('ascii', 'ignore')
+    return [term for term, term_bytes in _TERM_BYTES if term_bytes in region]
+
+
+def parse_result_block(buf: str, buf_lower: Optional[str], start: int, end: int,
+                       source: str, urls: Set[str]) -> Optional[Finding]:
+    """Parse one result block, given as a (start, end) region of buf.
+
+    buf_lower is buf.lower() when that preserved offsets, else None and
+    the block region is lowered here instead.
+    """
+    raw = buf[start:min(start + 500, end)]  # First 500 chars for reference
+
+    # Extract title (first non-blank line)
+    title_start = start
+    while title_start < end and buf[title_start] in ' \t\r\n':
+        title_start += 1
+    newline = buf.find('\n', title_start, end)
+    title = buf[title_start:(newline if newline != -1 else end)].strip()
+
+    # Extract URL, relevance and excerpts in a single scan of the block
+    url = ''
+    relevance = 'unknown'
+    excerpts = []
+    for match in _BLOCK_RE.finditer(buf, start, end):
+        matched_url = match.group('url')
+        if matched_url is not None:
+            if not url:
+                url = matched_url
+                urls.add(url)
+            continue
+        rel = match.group('rel')
+        if rel is not None:
+            if relevance == 'unknown':
+                relevance = rel.lower()
+            continue
+        if len(excerpts) < 3:
+            excerpts.append(match.group('excerpt'))
+
+    if not title:
+        return None
+
+    return Finding(
+        source=source,
+        title=title,
+        url=url,
+        relevance=relevance,
+        excerpts=excerpts,  # Keep top 3
+        topics=(match_topics(buf_lower, start, end) if buf_lower is not None
+                else match_topics(buf[start:end].lower())),
+        raw=raw,
+    )
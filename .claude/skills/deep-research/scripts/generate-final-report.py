@@ -16,16 +16,48 @@ import os
 import sys
 import re
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, IO, List, Optional
 import argparse
 
+# Precompiled patterns - compiled once at import so repeated report runs
+# skip the re-cache lookup on every search
+# re.ASCII on the hot patterns below: they match markdown structure and
+# metadata labels, so the Unicode \s/\d/\w tables are never needed
+_ITER_RE = re.compile(r'Iteration[:\s]+(\d+)', re.ASCII)
+_FINDING_RE = re.compile(r'^#+\s+Finding', re.MULTILINE | re.ASCII)
+_CONF_RE = re.compile(r'Confidence Level[:\s]+(\w+)', re.ASCII)
+_URLS_SECTION_RE = re.compile(r'## All URLs Referenced(.*?)(?=^## |\Z)', re.MULTILINE | re.DOTALL)
+_SECTION_SPLIT_RE = re.compile(r'^## (.+?)\s*\n', re.MULTILINE | re.ASCII)
+
+
+def _parse_sections(content: str) -> Dict[str, str]:
+    """Split a markdown document into {heading: body} with one scan"""
+    pieces = _SECTION_SPLIT_RE.split(content)
+    sections: Dict[str, str] = {}
+    # pieces is [preamble, name1, body1, name2, body2, ...]
+    for i in range(1, len(pieces) - 1, 2):
+        sections.setdefault(pieces[i], pieces[i + 1].strip())
+    return sections
+
+
+def _count_md(directory: Path) -> int:
+    """Count .md files via os.scandir - no per-entry stat or Path objects"""
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for e in it if e.name.endswith('.md') and e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
 
 class ReportGenerator:
     def __init__(self, session_path: str):
         self.session_path = Path(session_path)
         self.topic = self._extract_topic()
         self.stats = {}
+        self._file_cache: Dict[str, Optional[str]] = {}
+        # One clock read per generator; the header claims UTC, so use UTC
+        self.timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     
     def _extract_topic(self) -> str:
         """Extract topic from session folder name"""
@@ -36,8 +68,8 @@ class ReportGenerator:
             return parts[3].replace('-', ' ').title()
         return name
     
-    def generate(self) -> str:
-        """Generate the final research report"""
+    def generate(self, out: IO[str]) -> None:
+        """Generate the final research report and stream it to out"""
         
         print(f"Generating final report for: {self.topic}")
         
@@ -48,77 +80,74 @@ class ReportGenerator:
         merged = self._read_file("03-synthesis/merged-findings.md")
         
         # Calculate statistics
-        self._calculate_stats()
-        
+        self._calculate_stats(synthesis)
+
         # Build report
-        return self._build_report(research_plan, synthesis, validation, merged)
-    
+        self._write_report(out, research_plan, synthesis, validation, merged)
+
     def _read_file(self, relative_path: str) -> Optional[str]:
-        """Read a file if it exists"""
+        """Read a file if it exists, caching so repeat lookups skip the disk"""
+        if relative_path in self._file_cache:
+            return self._file_cache[relative_path]
+
         file_path = self.session_path / relative_path
         if file_path.exists():
-            return file_path.read_text(encoding='utf-8')
-        return None
-    
-    def _calculate_stats(self):
+            content = file_path.read_bytes().decode('utf-8')
+        else:
+            content = None
+        self._file_cache[relative_path] = content
+        return content
+
+    def _calculate_stats(self, synthesis: Optional[str]):
         """Calculate research statistics"""
-        
+
         # Count files in each directory
         results_dir = self.session_path / "01-search-results"
         deep_dives_dir = self.session_path / "02-deep-dives"
-        
-        self.stats['search_results'] = len(list(results_dir.glob("*.md"))) - 1 if results_dir.exists() else 0
-        self.stats['deep_dives'] = len(list(deep_dives_dir.glob("*.md"))) if deep_dives_dir.exists() else 0
-        
+
+        search_files = _count_md(results_dir)
+        self.stats['search_results'] = max(search_files - 1, 0)  # minus coverage matrix
+        self.stats['deep_dives'] = _count_md(deep_dives_dir)
+
         # Extract iteration from synthesis
-        synthesis = self._read_file("03-synthesis/current-understanding.md")
         if synthesis:
-            match = re.search(r'Iteration[:\s]+(\d+)', synthesis)
+            match = _ITER_RE.search(synthesis)
             self.stats['iterations'] = int(match.group(1)) if match else 0
-            
+
             # Count findings
-            self.stats['findings'] = len(re.findall(r'^#+\s+Finding', synthesis, re.MULTILINE))
-            
+            self.stats['findings'] = len(_FINDING_RE.findall(synthesis))
+
             # Extract confidence level
-            conf_match = re.search(r'Confidence Level[:\s]+(\w+)', synthesis)
+            conf_match = _CONF_RE.search(synthesis)
             self.stats['confidence'] = conf_match.group(1) if conf_match else 'Unknown'
     
-    def _extract_section(self, content: str, section_name: str) -> str:
-        """Extract a section from markdown content"""
-        pattern = rf'^## {section_name}\s*\n(.*?)(?=^## |\Z)'
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-        return match.group(1).strip() if match else ""
-    
-    def _build_report(self, plan: str, synthesis: str, validation: str, merged: str) -> str:
-        """Build the final report"""
+    def _write_report(self, out: IO[str], plan: str, synthesis: str,
+                      validation: str, merged: str) -> None:
+        """Write the final report to out"""
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
         session_name = self.session_path.name
         
-        # Extract key sections from synthesis if available
-        exec_summary = ""
-        high_confidence = ""
-        recommendations = ""
-        open_questions = ""
-        
-        if synthesis:
-            exec_summary = self._extract_section(synthesis, "Executive Summary")
-            high_confidence = self._extract_section(synthesis, "High Confidence Findings") or \
-                             self._extract_section(synthesis, "Detailed Findings")
-            recommendations = self._extract_section(synthesis, "Preliminary Recommendations") or \
-                             self._extract_section(synthesis, "Recommendations")
-            open_questions = self._extract_section(synthesis, "Open Questions") or \
-                            self._extract_section(synthesis, "Remaining Knowledge Gaps")
-        
+        # Extract key sections from synthesis if available; each document is
+        # split into a {heading: body} dict once instead of re-scanned per name
+        sections = _parse_sections(synthesis) if synthesis else {}
+        exec_summary = sections.get("Executive Summary", "")
+        high_confidence = sections.get("High Confidence Findings") or \
+                          sections.get("Detailed Findings", "")
+        recommendations = sections.get("Preliminary Recommendations") or \
+                          sections.get("Recommendations", "")
+        open_questions = sections.get("Open Questions") or \
+                         sections.get("Remaining Knowledge Gaps", "")
+
         # Extract validation summary
-        validation_summary = ""
-        if validation:
-            validation_summary = self._extract_section(validation, "Validation Summary") or \
-                                self._extract_section(validation, "Completed Validations")
+        validation_sections = _parse_sections(validation) if validation else {}
+        validation_summary = validation_sections.get("Validation Summary") or \
+                             validation_sections.get("Completed Validations", "")
         
-        report = f"""# Deep Research Report: {self.topic}
+        # Stream chunks straight to the output; peak memory stays at one
+        # chunk rather than the whole report
+        out.write(f"""# Deep Research Report: {self.topic}
 
-**Generated**: {timestamp}
+**Generated**: {self.timestamp}
 **Session ID**: {session_name}
 **Research Duration**: {self.stats.get('iterations', 'N/A')} iterations
 **Overall Confidence**: {self.stats.get('confidence', 'N/A')}
@@ -178,16 +207,16 @@ The research covered the following source categories:
 
 ### Research Questions
 
-"""
+""")
         # Try to extract research questions from plan
         if plan:
-            questions_match = re.search(r'## Research Question\s*\n(.*?)(?=^## |\Z)', plan, re.MULTILINE | re.DOTALL)
-            if questions_match:
-                report += questions_match.group(1).strip() + "\n\n"
+            questions = _parse_sections(plan).get("Research Question", "")
+            if questions:
+                out.write(questions + "\n\n")
             else:
-                report += f"*Primary question*: What is the best approach for {self.topic}?\n\n"
-        
-        report += f"""---
+                out.write(f"*Primary question*: What is the best approach for {self.topic}?\n\n")
+
+        out.write(f"""---
 
 ## Key Findings
 
@@ -268,24 +297,22 @@ See `00-research-plan.md` for detailed research log with timestamps.
 
 ### C. Full Source List
 
-"""
+""")
         # Add merged findings summary if available
         if merged:
-            urls_section = re.search(r'## All URLs Referenced(.*?)(?=^## |\Z)', merged, re.MULTILINE | re.DOTALL)
+            urls_section = _URLS_SECTION_RE.search(merged)
             if urls_section:
-                report += urls_section.group(0)
+                out.write(urls_section.group(0))
             else:
-                report += "See `03-synthesis/merged-findings.md` for complete source list.\n"
+                out.write("See `03-synthesis/merged-findings.md` for complete source list.\n")
         else:
-            report += "See individual files in `01-search-results/` for sources.\n"
-        
-        report += """
+            out.write("See individual files in `01-search-results/` for sources.\n")
+
+        out.write("""
 ---
 
 *This report was generated by the Deep Research system. For questions about methodology or findings, consult the detailed session files.*
-"""
-        
-        return report
+""")
 
 
 def main():
@@ -296,14 +323,15 @@ def main():
     args = parser.parse_args()
     
     generator = ReportGenerator(args.session_path)
-    report = generator.generate()
-    
+
     if args.output:
         output_path = Path(args.output)
     else:
         output_path = Path(args.session_path) / "FINAL-REPORT.md"
-    
-    output_path.write_text(report, encoding='utf-8')
+
+    # Stream the report through a wide buffer instead of materializing it
+    with output_path.open('w', encoding='utf-8', buffering=1 << 20) as out:
+        generator.generate(out)
     print(f"\nFinal report written to: {output_path}")
     print("\nReport generation complete!")
 
@@ -17,21 +17,111 @@ import sys
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Set, Any
+from typing import Dict, IO, List, Tuple, Set
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+# Precompiled patterns - these run once per result block / deep-dive item,
+# so compiling at module load avoids the re-cache lookup on every call
+# re.ASCII keeps \s/\S/\d as plain bytemap checks - this is markdown
+# structure and URLs, which are ASCII, so Unicode property lookups are waste
+_RESULT_RE = re.compile(r'### (?:Result\s*\d+[:\s]+)?(.+?)(?=###|\Z)', re.DOTALL | re.ASCII)
+_KEY_FINDINGS_RE = re.compile(r'## Key (?:Findings|Takeaways)(.+?)(?=##|\Z)', re.DOTALL | re.IGNORECASE)
+_ITEM_RE = re.compile(r'^\s*(?:\d+\.|[-*])\s*(.+)', re.MULTILINE | re.ASCII)
+
+# The block-parsing and topic-matching hot path lives in _merge_hot so it
+# can be JIT/AOT compiled: --jit builds it with Cython via pyximport when
+# available, and the plain module also imports as-is under PyPy. The flag
+# is checked before import so the compiled build is picked up.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if '--jit' in sys.argv:
+    try:
+        import pyximport
+        pyximport.install(pyimport=True, language_level=3)
+    except ImportError:
+        print("Warning: --jit requested but Cython/pyximport is not installed")
+import _merge_hot
+from _merge_hot import Finding
+
+# Keep URLs ordered on insert when sortedcontainers is available, so the
+# report emits them without an O(n log n) sort burst (plain set otherwise)
+try:
+    from sortedcontainers import SortedSet as _UrlSet
+except ImportError:
+    _UrlSet = set
+
+# Relevance values treated as "high relevance" in the report
+_HIGH_REL = frozenset({'high', '5', '4'})
+
+
+def _topic_size(item: Tuple[str, List[Finding]]) -> int:
+    """Sort key: number of findings grouped under a topic"""
+    return len(item[1])
+
+
+def _source_total(item: Tuple[str, Dict[str, int]]) -> int:
+    """Sort key: total findings attributed to a source"""
+    return item[1]['total']
+
+
+def _list_md(directory: Path, exclude: Tuple[str, ...] = ()) -> List[Tuple[str, str]]:
+    """List (name, path) for markdown files in a directory.
+
+    os.scandir exposes the dirent type from readdir, so the filter needs
+    no per-entry stat call and no Path object construction.
+    """
+    entries = []
+    try:
+        it = os.scandir(directory)
+    except NotADirectoryError:
+        # A stray file occupying the directory name yields no markdown,
+        # same as globbing it would
+        return entries
+    with it:
+        for entry in it:
+            name = entry.name
+            if name.endswith('.md') and name not in exclude and entry.is_file():
+                entries.append((name, entry.path))
+    return entries
+
+
+def _read_file(path: str) -> str:
+    """Read a whole file through a raw descriptor.
+
+    Sized from fstat and read with os.read, this skips the BufferedIO
+    stack that open()/read_text set up per file - worthwhile when a
+    session holds hundreds of small markdown files.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, size or 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks).decode('utf-8')
+    finally:
+        os.close(fd)
+
 
 class FindingsMerger:
     def __init__(self, session_path: str):
         self.session_path = Path(session_path)
-        self.findings: List[Dict[str, Any]] = []
+        self.findings: List[Finding] = []
         self.sources: Dict[str, List[str]] = defaultdict(list)
-        self.topics: Dict[str, List[Dict]] = defaultdict(list)
-        self.urls: Set[str] = set()
+        self.topics: Dict[str, List[Finding]] = defaultdict(list)
+        self.urls: Set[str] = _UrlSet()
+        self.dup_sources: Dict[str, List[str]] = {}
+        self.high_rel: List[Finding] = []
+        self.high_rel_by_topic: Dict[str, List[Finding]] = defaultdict(list)
+        self.timestamp = datetime.now().isoformat()
+        self.source_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {'total': 0, 'high': 0})
     
-    def merge(self) -> str:
-        """Merge all findings and return markdown report"""
+    def merge(self, out: IO[str]) -> None:
+        """Merge all findings and stream the markdown report to out"""
         
         print(f"Merging findings from: {self.session_path}")
         
@@ -45,7 +135,7 @@ class FindingsMerger:
         self._analyze_findings()
         
         # Generate merged report
-        return self._generate_report()
+        self._write_report(out)
     
     def _collect_search_results(self):
         """Extract findings from search result files"""
@@ -55,155 +145,147 @@ class FindingsMerger:
             print("Warning: No search results directory found")
             return
         
-        for result_file in results_dir.glob("*.md"):
-            if result_file.name == "coverage-matrix.md":
-                continue
-            
-            print(f"  Processing: {result_file.name}")
-            content = result_file.read_text(encoding='utf-8')
-            
+        files = _list_md(results_dir, exclude=('coverage-matrix.md',))
+
+        for name, content in self._read_files(files):
+            print(f"  Processing: {name}")
+
             # Extract source name from filename
-            source_name = result_file.stem
-            
+            source_name = name[:-3]
+
             # Extract results sections
             results = self._extract_results(content, source_name)
             self.findings.extend(results)
-    
+
     def _collect_deep_dives(self):
         """Extract findings from deep dive files"""
         deep_dives_dir = self.session_path / "02-deep-dives"
-        
+
         if not deep_dives_dir.exists():
             return
-        
-        for dive_file in deep_dives_dir.glob("*.md"):
-            print(f"  Processing deep dive: {dive_file.name}")
-            content = dive_file.read_text(encoding='utf-8')
-            
-            source_name = f"deep-dive:{dive_file.stem}"
-            
+
+        for name, content in self._read_files(_list_md(deep_dives_dir)):
+            print(f"  Processing deep dive: {name}")
+
+            source_name = f"deep-dive:{name[:-3]}"
+
             # Extract key findings
             findings = self._extract_deep_dive_findings(content, source_name)
             self.findings.extend(findings)
+
+    def _read_files(self, files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Read (name, path) entries concurrently, preserving input order.
+
+        The interpreter releases the GIL during reads, so a thread pool
+        overlaps the per-file I/O latency across many small markdown files.
+        """
+        if not files:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            contents = executor.map(_read_file, (path for _, path in files))
+            return [(name, content) for (name, _), content in zip(files, contents)]
     
-    def _extract_results(self, content: str, source: str) -> List[Dict]:
+    def _extract_results(self, content: str, source: str) -> List[Finding]:
         """Extract individual results from a search results file"""
         findings = []
-        
-        # Match result blocks (### Result N: Title pattern)
-        result_pattern = r'### (?:Result\s*\d+[:\s]+)?(.+?)(?=###|\Z)'
-        matches = re.findall(result_pattern, content, re.DOTALL)
-        
-        for match in matches:
-            finding = self._parse_result_block(match, source)
+
+        # Lowercase the whole file once; per-block topic scans reuse it.
+        # str.lower() is not length-preserving for a few code points
+        # (e.g. 'İ' becomes two), which would skew every block's topic
+        # window - fall back to per-block lowering in that rare case
+        content_lower = content.lower()
+        if len(content_lower) != len(content):
+            content_lower = None
+
+        # Match result blocks (### Result N: Title pattern); finditer with
+        # pos/endpos slicing avoids materializing every block as its own str
+        for match in _RESULT_RE.finditer(content):
+            finding = _merge_hot.parse_result_block(
+                content, content_lower, match.start(1), match.end(1), source, self.urls)
             if finding:
                 findings.append(finding)
-        
+
         return findings
-    
-    def _parse_result_block(self, block: str, source: str) -> Dict:
-        """Parse a single result block into structured data"""
-        finding = {
-            'source': source,
-            'title': '',
-            'url': '',
-            'relevance': 'unknown',
-            'excerpts': [],
-            'topics': [],
-            'raw': block[:500]  # First 500 chars for reference
-        }
-        
-        # Extract title (first line)
-        lines = block.strip().split('\n')
-        if lines:
-            finding['title'] = lines[0].strip()
-        
-        # Extract URL
-        url_match = re.search(r'\*\*URL\*\*:\s*(\S+)', block)
-        if url_match:
-            finding['url'] = url_match.group(1)
-            self.urls.add(finding['url'])
-        
-        # Extract relevance
-        rel_match = re.search(r'\*\*Relevance\*\*:\s*(\d+|high|medium|low)', block, re.IGNORECASE)
-        if rel_match:
-            finding['relevance'] = rel_match.group(1).lower()
-        
-        # Extract excerpts (quoted text)
-        excerpts = re.findall(r'>\s*(.+)', block)
-        finding['excerpts'] = excerpts[:3]  # Keep top 3
-        
-        # Identify topics (simple keyword extraction)
-        finding['topics'] = self._extract_topics(block)
-        
-        return finding if finding['title'] else None
-    
-    def _extract_deep_dive_findings(self, content: str, source: str) -> List[Dict]:
+
+    def _extract_deep_dive_findings(self, content: str, source: str) -> List[Finding]:
         """Extract findings from deep dive format"""
         findings = []
         
         # Look for Key Findings section
-        findings_match = re.search(r'## Key (?:Findings|Takeaways)(.+?)(?=##|\Z)', content, re.DOTALL | re.IGNORECASE)
-        
+        findings_match = _KEY_FINDINGS_RE.search(content)
+
         if findings_match:
             section = findings_match.group(1)
             # Extract numbered or bulleted items
-            items = re.findall(r'^\s*(?:\d+\.|[-*])\s*(.+)', section, re.MULTILINE)
+            items = _ITEM_RE.findall(section)
             
             for item in items:
-                findings.append({
-                    'source': source,
-                    'title': item[:100],
-                    'url': '',
-                    'relevance': 'high',  # Deep dives are presumably high relevance
-                    'excerpts': [item],
-                    'topics': self._extract_topics(item),
-                    'raw': item
-                })
+                findings.append(Finding(
+                    source=source,
+                    title=item[:100],
+                    relevance='high',  # Deep dives are presumably high relevance
+                    excerpts=[item],
+                    topics=self._extract_topics(item),
+                    raw=item
+                ))
         
         return findings
     
     def _extract_topics(self, text: str) -> List[str]:
         """Extract topic keywords from text"""
-        # Common technical terms to look for
-        tech_terms = [
-            'rag', 'llm', 'embedding', 'vector', 'chunk', 'retrieval',
-            'architecture', 'implementation', 'performance', 'latency',
-            'accuracy', 'benchmark', 'production', 'scalability',
-            'api', 'model', 'training', 'inference', 'fine-tuning'
-        ]
-        
-        text_lower = text.lower()
-        found = [term for term in tech_terms if term in text_lower]
-        
-        return found
-    
+        return _merge_hot.match_topics(text.lower())
+
     def _analyze_findings(self):
         """Analyze findings for patterns, duplicates, conflicts"""
-        
-        # Group by URL (exact duplicates)
-        url_groups = defaultdict(list)
-        for finding in self.findings:
-            if finding['url']:
-                url_groups[finding['url']].append(finding)
-        
-        # Group by topic
+
+        # One pass over the findings builds every grouping the report needs.
+        # Most URLs appear once, so duplicates are tracked with a first-seen
+        # map that only grows a source list once a second occurrence shows up
+        first_source: Dict[str, str] = {}
         for finding in self.findings:
-            for topic in finding['topics']:
+            # Group by URL (exact duplicates)
+            url = finding.url
+            if url:
+                sources = self.dup_sources.get(url)
+                if sources is not None:
+                    sources.append(finding.source)
+                elif url in first_source:
+                    self.dup_sources[url] = [first_source.pop(url), finding.source]
+                else:
+                    first_source[url] = finding.source
+
+            # Group by topic, indexing high-relevance findings as we go
+            is_high = finding.relevance in _HIGH_REL
+            for topic in finding.topics:
                 self.topics[topic].append(finding)
-        
-        # Track sources per finding
-        for finding in self.findings:
-            self.sources[finding['title'][:50]].append(finding['source'])
+                if is_high:
+                    self.high_rel_by_topic[topic].append(finding)
+
+            if is_high:
+                self.high_rel.append(finding)
+
+            # Track sources per finding
+            self.sources[finding.title[:50]].append(finding.source)
+
+            # Findings (and high-relevance findings) per source
+            counts = self.source_counts[finding.source]
+            counts['total'] += 1
+            if is_high:
+                counts['high'] += 1
     
-    def _generate_report(self) -> str:
-        """Generate merged findings report"""
-        
-        timestamp = datetime.now().isoformat()
+    def _write_report(self, out: IO[str]) -> None:
+        """Write the merged findings report to out"""
         
-        report = f"""# Merged Research Findings
+        # Split search-result vs deep-dive counts in one pass
+        n_deep = sum(1 for f in self.findings if f.source.startswith('deep-dive:'))
+        n_search = len(self.findings) - n_deep
+
+        # Stream chunks straight to the output; peak memory stays at one
+        # chunk rather than the whole report
+        out.write(f"""# Merged Research Findings
 
-**Generated**: {timestamp}
+**Generated**: {self.timestamp}
 **Session**: {self.session_path}
 **Total Findings**: {len(self.findings)}
 **Unique URLs**: {len(self.urls)}
@@ -212,77 +294,66 @@ class FindingsMerger:
 
 ## Summary Statistics
 
-- **Findings from search results**: {len([f for f in self.findings if 'deep-dive' not in f['source']])}
-- **Findings from deep dives**: {len([f for f in self.findings if 'deep-dive' in f['source']])}
+- **Findings from search results**: {n_search}
+- **Findings from deep dives**: {n_deep}
 - **Topics identified**: {len(self.topics)}
 
 ---
 
 ## Findings by Topic
 
-"""
+""")
         # Sort topics by number of findings
-        sorted_topics = sorted(self.topics.items(), key=lambda x: len(x[1]), reverse=True)
-        
+        sorted_topics = sorted(self.topics.items(), key=_topic_size, reverse=True)
+
         for topic, topic_findings in sorted_topics[:10]:  # Top 10 topics
-            report += f"\n### {topic.upper()} ({len(topic_findings)} findings)\n\n"
-            
+            out.write(f"\n### {topic.upper()} ({len(topic_findings)} findings)\n\n")
+
             # Show top 5 findings for this topic
-            high_rel = [f for f in topic_findings if f['relevance'] in ['high', '5', '4']]
-            to_show = (high_rel or topic_findings)[:5]
-            
+            to_show = (self.high_rel_by_topic.get(topic) or topic_findings)[:5]
+
             for finding in to_show:
-                report += f"- **{finding['title'][:80]}**\n"
-                report += f"  - Source: {finding['source']}\n"
-                if finding['url']:
-                    report += f"  - URL: {finding['url']}\n"
-                if finding['excerpts']:
-                    report += f"  - Key: \"{finding['excerpts'][0][:100]}...\"\n"
-                report += "\n"
+                out.write(f"- **{finding.title[:80]}**\n")
+                out.write(f"  - Source: {finding.source}\n")
+                if finding.url:
+                    out.write(f"  - URL: {finding.url}\n")
+                if finding.excerpts:
+                    out.write(f"  - Key: \"{finding.excerpts[0][:100]}...\"\n")
+                out.write("\n")
 
-        report += """---
+        out.write("""---
 
 ## Potential Duplicates
 
 *Findings from multiple sources covering the same URL:*
 
-"""
-        # Find duplicates
-        url_groups = defaultdict(list)
-        for finding in self.findings:
-            if finding['url']:
-                url_groups[finding['url']].append(finding['source'])
-        
-        duplicates = {url: sources for url, sources in url_groups.items() if len(sources) > 1}
-        
-        if duplicates:
-            for url, sources in list(duplicates.items())[:10]:
-                report += f"- {url}\n"
-                report += f"  - Found in: {', '.join(sources)}\n"
+""")
+        if self.dup_sources:
+            for url, sources in list(self.dup_sources.items())[:10]:
+                out.write(f"- {url}\n")
+                out.write(f"  - Found in: {', '.join(sources)}\n")
         else:
-            report += "*No duplicates found*\n"
+            out.write("*No duplicates found*\n")
 
-        report += """
+        out.write("""
 ---
 
 ## High Relevance Findings
 
 *Findings marked as high relevance:*
 
-"""
-        high_rel = [f for f in self.findings if f['relevance'] in ['high', '5', '4']]
-        
-        for finding in high_rel[:15]:
-            report += f"### {finding['title'][:80]}\n"
-            report += f"- **Source**: {finding['source']}\n"
-            if finding['url']:
-                report += f"- **URL**: {finding['url']}\n"
-            report += f"- **Topics**: {', '.join(finding['topics']) or 'N/A'}\n"
-            if finding['excerpts']:
-                report += f"- **Key excerpt**:\n  > {finding['excerpts'][0][:200]}\n"
-            report += "\n"
-
-        report += """---
+""")
+        for finding in self.high_rel[:15]:
+            out.write(f"### {finding.title[:80]}\n")
+            out.write(f"- **Source**: {finding.source}\n")
+            if finding.url:
+                out.write(f"- **URL**: {finding.url}\n")
+            out.write(f"- **Topics**: {', '.join(finding.topics) or 'N/A'}\n")
+            if finding.excerpts:
+                out.write(f"- **Key excerpt**:\n  > {finding.excerpts[0][:200]}\n")
+            out.write("\n")
+
+        out.write("""---
 
 ## Source Coverage
 
@@ -290,17 +361,11 @@ class FindingsMerger:
 
 | Source | Findings | High Relevance |
 |--------|----------|----------------|
-"""
-        source_counts = defaultdict(lambda: {'total': 0, 'high': 0})
-        for finding in self.findings:
-            source_counts[finding['source']]['total'] += 1
-            if finding['relevance'] in ['high', '5', '4']:
-                source_counts[finding['source']]['high'] += 1
-        
-        for source, counts in sorted(source_counts.items(), key=lambda x: x[1]['total'], reverse=True):
-            report += f"| {source} | {counts['total']} | {counts['high']} |\n"
+""")
+        for source, counts in sorted(self.source_counts.items(), key=_source_total, reverse=True):
+            out.write(f"| {source} | {counts['total']} | {counts['high']} |\n")
 
-        report += """
+        out.write("""
 ---
 
 ## All URLs Referenced
@@ -308,36 +373,37 @@ class FindingsMerger:
 <details>
 <summary>Click to expand ({} URLs)</summary>
 
-""".format(len(self.urls))
+""".format(len(self.urls)))
 
-        for url in sorted(self.urls):
-            report += f"- {url}\n"
-        
-        report += "\n</details>\n"
+        urls = self.urls if _UrlSet is not set else sorted(self.urls)
+        for url in urls:
+            out.write(f"- {url}\n")
 
-        return report
+        out.write("\n</details>\n")
 
 
 def main():
     parser = argparse.ArgumentParser(description='Merge research findings')
     parser.add_argument('session_path', help='Path to research session')
     parser.add_argument('--output', '-o', help='Output file path', default=None)
-    
+    parser.add_argument('--jit', action='store_true',
+                        help='Compile hot-path helpers with Cython (needs Cython installed)')
+
     args = parser.parse_args()
     
     merger = FindingsMerger(args.session_path)
-    report = merger.merge()
-    
+
     if args.output:
         output_path = Path(args.output)
-        output_path.write_text(report, encoding='utf-8')
-        print(f"\nReport written to: {output_path}")
     else:
         # Write to session directory
         output_path = Path(args.session_path) / "03-synthesis" / "merged-findings.md"
-        output_path.write_text(report, encoding='utf-8')
-        print(f"\nReport written to: {output_path}")
-    
+
+    # Stream the report through a wide buffer instead of materializing it
+    with output_path.open('w', encoding='utf-8', buffering=1 << 20) as out:
+        merger.merge(out)
+    print(f"\nReport written to: {output_path}")
+
     print("\nMerge complete!")
 
 